@@ -5,6 +5,9 @@ import time
 import random
 import io
 import contextlib
+import functools
+import itertools
+from collections import deque
 from datetime import datetime
 
 # ==========================================
@@ -27,85 +30,133 @@ THEME = {
 SCREEN_WIDTH = 900
 SCREEN_HEIGHT = 700
 TASKBAR_HEIGHT = 40
+TASKBAR_RECT = (0, SCREEN_HEIGHT - TASKBAR_HEIGHT, SCREEN_WIDTH, TASKBAR_HEIGHT)
+CLOCK_RECT = (SCREEN_WIDTH - 60, SCREEN_HEIGHT - TASKBAR_HEIGHT, 60, TASKBAR_HEIGHT)
+
+# ==========================================
+# TEXT RENDER CACHE
+# ==========================================
+class RenderCache:
+    def __init__(self, maxsize=256):
+        # Keyed on (font, text, color); returned surfaces are shared, never draw onto them.
+        # Only for stable labels: text that changes every frame is rendered directly instead.
+        self.get = functools.lru_cache(maxsize=maxsize)(self._render)
+
+    @staticmethod
+    def _render(font, text, color):
+        return font.render(text, True, color).convert_alpha()
 
 # ==========================================
 # MODULAR CPU ARCHITECTURE (Virtual Machine)
 # ==========================================
-class Memory:
-    def __init__(self, size):
-        self.data = [0] * size
-    def read(self, addr): return self.data[addr % len(self.data)]
-    def write(self, addr, val): self.data[addr % len(self.data)] = val & 0xFF
+# Opcodes are decoded to ints once at load; ALU ops come first so dispatch is a range check
+OPCODE_NAMES = ("ADD", "SUB", "MUL", "AND", "OR", "XOR", "BSL", "NOP", "OUT", "JMP", "BEQ")
+OP_ADD, OP_SUB, OP_MUL, OP_AND, OP_OR, OP_XOR, OP_BSL, OP_NOP, OP_OUT, OP_JMP, OP_BEQ = range(len(OPCODE_NAMES))
+OPCODES = {name: i for i, name in enumerate(OPCODE_NAMES)}
+
+BLANK_SCREEN = bytes(32 * 32)
+PIPE_STAGES = ("F", "D", "E", "W")
+
+ALU_TABLE = (
+    lambda v1, v2: (v1 + v2) & 0xFF,  # ADD
+    lambda v1, v2: (v1 - v2) & 0xFF,  # SUB
+    lambda v1, v2: (v1 * v2) & 0xFF,  # MUL
+    lambda v1, v2: v1 & v2,           # AND
+    lambda v1, v2: v1 | v2,           # OR
+    lambda v1, v2: v1 ^ v2,           # XOR
+    lambda v1, v2: (v1 << v2) & 0xFF, # BSL
+    lambda v1, v2: 0,                 # NOP (unknown opcodes)
+)
 
 class ALU:
     def execute(self, op, v1, v2):
-        if op == "ADD": return (v1 + v2) & 0xFF
-        if op == "SUB": return (v1 - v2) & 0xFF
-        if op == "MUL": return (v1 * v2) & 0xFF
-        if op == "AND": return v1 & v2
-        if op == "OR":  return v1 | v2
-        if op == "XOR": return v1 ^ v2
-        if op == "BSL": return (v1 << v2) & 0xFF
-        return 0
+        return ALU_TABLE[op](v1, v2)
 
 class ModularCPU:
     def __init__(self, rom_data):
         self.core_id = 0
-        self.regs = [0] * 8
+        self.regs = bytearray(8)
         self.pc = 0
-        self.rom = rom_data
-        self.ram = Memory(256)
-        self.ports = [0] * 256
-        self.screen = [[0]*32 for _ in range(32)]
-        self.pipeline = {"F": None, "D": None, "E": None, "W": None}
+        self.rom_display = rom_data
+        self.rom = self.decode(rom_data)
+        self.ram = bytearray(256) # Index with addr & 0xFF
+        self.ports = bytearray(256)
+        self.screen = bytearray(32 * 32) # Row-major, index y*32 + x
+        self.pipe = [None] * len(PIPE_STAGES) # Indexed F=0, D=1, E=2, W=3
         self.alu = ALU()
 
-    def resolve(self, op):
+    @staticmethod
+    def decode_operand(op):
+        # (is_reg, value): register index or literal
         if isinstance(op, str) and op.startswith("R"):
-            if self.pipeline["W"] and self.pipeline["W"][1] == op:
-                return self.pipeline["W"][0]
-            return self.regs[int(op[1:])]
-        return int(op) if op is not None else 0
+            return True, int(op[1:])
+        return False, int(op) if op is not None else 0
+
+    @staticmethod
+    def decode(rom_data):
+        # (opcode, dest_is_reg, dest, a1_is_reg, a1, a2_is_reg, a2); empty slots stay falsy and halt fetch
+        rom = []
+        for inst in rom_data:
+            if not inst:
+                rom.append(None)
+                continue
+            op, dest, arg1, arg2 = inst
+            rom.append((OPCODES.get(op, OP_NOP),) + ModularCPU.decode_operand(dest) +
+                       ModularCPU.decode_operand(arg1) + ModularCPU.decode_operand(arg2))
+        return rom
 
     def tick(self):
-        # 1. WRITEBACK
-        if self.pipeline["W"]:
-            val, target = self.pipeline["W"]
-            if isinstance(target, str) and target.startswith("R"):
-                self.regs[int(target[1:])] = val
-
-        # 2. EXECUTE
-        self.pipeline["W"] = None
-        if self.pipeline["E"]:
-            op, dest, arg1, arg2 = self.pipeline["E"]
-            v1, v2 = self.resolve(arg1), self.resolve(arg2)
-
-            if op == "OUT":
-                port = self.resolve(dest)
-                self.ports[port % 256] = v1
-                if port == 0: self.pipeline["W"] = (self.core_id, dest)
-                if port == 12: self.screen[self.ports[11]%32][self.ports[10]%32] = 1
-                if port == 13: self.screen = [[0]*32 for _ in range(32)]
-            elif op == "JMP":
-                self.pc = v2
-                self.pipeline["F"] = self.pipeline["D"] = None
-            elif op == "BEQ":
-                if self.resolve(dest) == v1:
-                    self.pc = v2
-                    self.pipeline["F"] = self.pipeline["D"] = None
+        self.tick_batch(1)
+
+    def tick_batch(self, n):
+        # All CPU state is bound to locals once and shared by the n ticks
+        regs, pipe, ports, screen = self.regs, self.pipe, self.ports, self.screen
+        rom, rom_len, core_id, alu_table = self.rom, len(self.rom), self.core_id, ALU_TABLE
+        pc = self.pc
+
+        for _ in range(n):
+            # 1. WRITEBACK
+            if pipe[3]:
+                val, is_reg, target = pipe[3]
+                if is_reg:
+                    regs[target] = val & 0xFF
+
+            # 2. EXECUTE
+            # W is empty from here on, so operands read the register file directly
+            pipe[3] = None
+            if pipe[2]:
+                op, dest_reg, dest, a1_reg, a1, a2_reg, a2 = pipe[2]
+                v1 = regs[a1] if a1_reg else a1
+                v2 = regs[a2] if a2_reg else a2
+
+                if op <= OP_NOP:
+                    pipe[3] = (alu_table[op](v1, v2), dest_reg, dest)
+                elif op == OP_OUT:
+                    port = regs[dest] if dest_reg else dest
+                    ports[port & 0xFF] = v1 & 0xFF
+                    if port == 0: pipe[3] = (core_id, dest_reg, dest)
+                    if port == 12: screen[(ports[11]%32)*32 + ports[10]%32] = 1
+                    if port == 13: screen[:] = BLANK_SCREEN
+                elif op == OP_JMP:
+                    pc = v2
+                    pipe[0] = pipe[1] = None
+                elif op == OP_BEQ:
+                    if (regs[dest] if dest_reg else dest) == v1:
+                        pc = v2
+                        pipe[0] = pipe[1] = None
+
+            # 3. PIPELINE MOVE
+            pipe[2] = pipe[1]
+            pipe[1] = pipe[0]
+
+            # 4. FETCH
+            if pc < rom_len and rom[pc]:
+                pipe[0] = rom[pc]
+                pc += 1
             else:
-                self.pipeline["W"] = (self.alu.execute(op, v1, v2), dest)
-
-        # 3. PIPELINE MOVE
-        self.pipeline["E"] = self.pipeline["D"]
-        self.pipeline["D"] = self.pipeline["F"]
+                pipe[0] = None
 
-        # 4. FETCH
-        if self.pc < len(self.rom) and self.rom[self.pc]:
-            self.pipeline["F"] = self.rom[self.pc]
-            self.pc += 1
-        else:
-            self.pipeline["F"] = None
+        self.pc = pc
 
 
 # ==========================================
@@ -120,6 +171,7 @@ class Application:
         self.os = os_kernel
         self.window = window
         self.load = 0.0 # CPU Load %
+        self.dirty = True # Surface needs redrawing
 
     def handle_event(self, event, local_mouse_pos): pass
     def update(self): pass
@@ -137,59 +189,85 @@ class TerminalApp(Application):
     def __init__(self, os_kernel, window):
         super().__init__(os_kernel, window)
         self.font = os_kernel.font_mono
-        self.scrollback = [
-            "Aethel OS: Nexus [Version 2.0]",
-            "Type 'help' for available commands.", ""
-        ]
+        # Rendered scrollback; new lines scroll it up instead of redrawing every line
+        w, h = window.rect.size
+        self.scroll_surf = pygame.Surface((w, h - 25)).convert()
+        self.scroll_surf.fill(THEME["window_bg"])
+        for line in ("Aethel OS: Nexus [Version 2.0]", "Type 'help' for available commands.", ""):
+            self.write_line(line)
         self.current_input = ""
         self.blink_timer = 0
+        # name -> (handler, takes_args); commands run only on an exact argument match
+        self.commands = {
+            "help": (self.cmd_help, False),
+            "clear": (self.cmd_clear, False),
+            "time": (self.cmd_time, False),
+            "ps": (self.cmd_ps, False),
+            "echo": (self.cmd_echo, True),
+        }
 
     def handle_event(self, event, local_mouse_pos):
         if event.type == pygame.KEYDOWN:
+            self.dirty = True
             if event.key == pygame.K_RETURN:
                 self.process_command(self.current_input)
                 self.current_input = ""
             elif event.key == pygame.K_BACKSPACE:
                 self.current_input = self.current_input[:-1]
-            elif event.unicode.isprintable():
+            elif len(event.unicode) == 1 and " " <= event.unicode <= "~":
                 self.current_input += event.unicode
 
+    def write_line(self, line):
+        line_y = self.scroll_surf.get_height() - 20
+        self.scroll_surf.scroll(0, -20)
+        self.scroll_surf.fill(THEME["window_bg"], (0, line_y, self.scroll_surf.get_width(), 20))
+        self.os.blit_mono(self.scroll_surf, line, THEME["text_main"], (10, line_y))
+
     def process_command(self, cmd):
-        self.scrollback.append(f"admin@nexus:~$ {cmd}")
-        cmd = cmd.strip().lower()
-        parts = cmd.split(" ")
-
-        if cmd == "help":
-            self.scrollback.extend(["Commands: help, clear, ps, time, echo [text]"])
-        elif cmd == "clear":
-            self.scrollback = []
-        elif cmd == "time":
-            self.scrollback.append(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        elif cmd == "ps":
-            self.scrollback.append("PID  MEM   CPU%   WINDOW TITLE")
-            for i, win in enumerate(self.os.windows):
-                self.scrollback.append(f"{i:<4} {win.app.MEMORY_FOOTPRINT:<3}MB {win.app.load:>4.1f}% {win.title}")
-        elif cmd.startswith("echo "):
-            self.scrollback.append(" ".join(parts[1:]))
-        elif cmd != "":
-            self.scrollback.append(f"Command not found: {parts[0]}")
-        self.scrollback.append("") 
+        self.dirty = True
+        self.write_line(f"admin@nexus:~$ {cmd}")
+        parts = cmd.strip().lower().split(" ", 1)
+
+        handler, takes_args = self.commands.get(parts[0], (None, False))
+        if handler and (len(parts) > 1) == takes_args:
+            handler(parts[1] if takes_args else "")
+        elif parts[0] != "":
+            self.write_line(f"Command not found: {parts[0]}")
+        self.write_line("") 
+
+    def cmd_help(self, args):
+        self.write_line("Commands: help, clear, ps, time, echo [text]")
+
+    def cmd_clear(self, args):
+        self.scroll_surf.fill(THEME["window_bg"])
+
+    def cmd_time(self, args):
+        self.write_line(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+    def cmd_ps(self, args):
+        self.write_line("PID  MEM   CPU%   WINDOW TITLE")
+        for i, win in enumerate(self.os.windows):
+            self.write_line(f"{i:<4} {win.app.MEMORY_FOOTPRINT:<3}MB {win.app.load:>4.1f}% {win.title}")
+
+    def cmd_echo(self, args):
+        self.write_line(args)
 
     def update(self):
         self.blink_timer = (self.blink_timer + 1) % 60
+        if self.blink_timer % 30 == 0: self.dirty = True
 
     def draw(self, surface):
         super().draw(surface)
         y_offset = surface.get_height() - 25
-        cursor = "_" if self.blink_timer < 30 else " "
-        prompt = f"admin@nexus:~$ {self.current_input}{cursor}"
-        surface.blit(self.font.render(prompt, True, THEME["accent"]), (10, y_offset))
+        prompt = f"admin@nexus:~$ {self.current_input}"
+        self.os.blit_mono(surface, prompt, THEME["accent"], (10, y_offset))
+        if self.blink_timer < 30:
+            cursor_x = 10 + self.os.mono_width(prompt)
+            pygame.draw.rect(surface, THEME["accent"], (cursor_x, y_offset + self.font.get_height() - 3, self.os.mono_advance, 2))
         
-        y_offset -= 20
-        for line in reversed(self.scrollback):
-            if y_offset < 0: break
-            surface.blit(self.font.render(line, True, THEME["text_main"]), (10, y_offset))
-            y_offset -= 20
+        # Only whole lines are shown, so skip the partial row at the top
+        top = self.scroll_surf.get_height() % 20
+        surface.blit(self.scroll_surf, (0, top), (0, top, self.scroll_surf.get_width(), self.scroll_surf.get_height() - top))
 
 
 class TaskManagerApp(Application):
@@ -200,33 +278,33 @@ class TaskManagerApp(Application):
     def __init__(self, os_kernel, window):
         super().__init__(os_kernel, window)
         self.font = os_kernel.font_main
-        self.history = [0.0] * 50
+        self.history = deque([0.0] * 50, maxlen=50)
+        self.graph_xs = None # Sample x positions, fixed by the graph geometry
         self.tick = 0
 
     def update(self):
         self.tick += 1
         if self.tick % 5 == 0:
-            self.history.pop(0)
             self.history.append(self.os.cpu_load)
+            self.dirty = True
 
     def draw(self, surface):
         super().draw(surface)
         w, h = surface.get_size()
         
-        surface.blit(self.font.render("System Load & Processes", True, THEME["accent"]), (10, 10))
+        surface.blit(self.os.render_cache.get(self.font, "System Load & Processes", THEME["accent"]), (10, 10))
 
         # Graph Background
         graph_rect = pygame.Rect(10, 35, w - 20, 80)
         pygame.draw.rect(surface, THEME["code_bg"], graph_rect)
         pygame.draw.rect(surface, THEME["title_bar"], graph_rect, 2)
 
-        max_val = max(5.0, max(self.history)) 
-        points = []
-        step_x = graph_rect.width / max(1, len(self.history) - 1)
-        for i, val in enumerate(self.history):
-            x = graph_rect.left + (i * step_x)
-            y = graph_rect.bottom - (val / max_val * graph_rect.height)
-            points.append((x, y))
+        if self.graph_xs is None:
+            step_x = graph_rect.width / max(1, len(self.history) - 1)
+            self.graph_xs = [graph_rect.left + i * step_x for i in range(len(self.history))]
+        scale_y = graph_rect.height / max(5.0, max(self.history))
+        bottom = graph_rect.bottom
+        points = [(x, bottom - val * scale_y) for x, val in zip(self.graph_xs, self.history)]
         
         if len(points) > 1:
             pygame.draw.lines(surface, THEME["accent"], False, points, 2)
@@ -240,7 +318,7 @@ class TaskManagerApp(Application):
         pygame.draw.rect(surface, THEME["code_bg"], list_rect)
         pygame.draw.rect(surface, THEME["title_bar"], list_rect, 2)
         
-        headers = self.font.render("PID   PROCESS NAME            RAM       CPU%", True, THEME["accent"])
+        headers = self.os.render_cache.get(self.font, "PID   PROCESS NAME            RAM       CPU%", THEME["accent"])
         surface.blit(headers, (15, 155))
         pygame.draw.line(surface, THEME["title_bar"], (15, 175), (w-15, 175))
 
@@ -261,8 +339,21 @@ class CodeEditorApp(Application):
         self.font = os_kernel.font_mono
         self.lines = ["print('Hello, Nexus OS!')", "for i in range(3):", "    print(f'Loop {i}')", ""]
         self.cx, self.cy = 0, 0
-        self.output = []
+        self.cursor_px = 0 # Pixel x of the cursor within its line, kept in step with cx/cy
+        self.output = deque(maxlen=200)
         self.blink = 0
+        # Per-line surfaces, re-rendered only for the lines an edit touches
+        self.line_surfs = [self.render_line(line) for line in self.lines]
+        self.linenum_surfs = []
+        self.sync_line_numbers()
+
+    def render_line(self, line):
+        return self.font.render(line, True, THEME["text_main"]).convert_alpha()
+
+    def sync_line_numbers(self):
+        while len(self.linenum_surfs) < len(self.lines):
+            self.linenum_surfs.append(self.font.render(str(len(self.linenum_surfs) + 1), True, (100, 100, 110)).convert_alpha())
+        del self.linenum_surfs[len(self.lines):]
 
     def handle_event(self, event, local_mouse_pos):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -271,6 +362,7 @@ class CodeEditorApp(Application):
                 self.execute_code()
         
         elif event.type == pygame.KEYDOWN:
+            self.dirty = True
             if event.key == pygame.K_UP:
                 self.cy = max(0, self.cy - 1)
                 self.cx = min(self.cx, len(self.lines[self.cy]))
@@ -291,26 +383,36 @@ class CodeEditorApp(Application):
                 curr = self.lines[self.cy]
                 self.lines[self.cy] = curr[:self.cx]
                 self.lines.insert(self.cy + 1, curr[self.cx:])
+                self.line_surfs[self.cy] = self.render_line(self.lines[self.cy])
+                self.line_surfs.insert(self.cy + 1, self.render_line(self.lines[self.cy + 1]))
+                self.sync_line_numbers()
                 self.cy += 1
                 self.cx = 0
             elif event.key == pygame.K_BACKSPACE:
                 if self.cx > 0:
                     curr = self.lines[self.cy]
                     self.lines[self.cy] = curr[:self.cx-1] + curr[self.cx:]
+                    self.line_surfs[self.cy] = self.render_line(self.lines[self.cy])
                     self.cx -= 1
                 elif self.cy > 0:
                     curr = self.lines.pop(self.cy)
+                    self.line_surfs.pop(self.cy)
+                    self.sync_line_numbers()
                     self.cy -= 1
                     self.cx = len(self.lines[self.cy])
                     self.lines[self.cy] += curr
+                    self.line_surfs[self.cy] = self.render_line(self.lines[self.cy])
             elif event.unicode.isprintable() and not event.key == pygame.K_TAB:
                 curr = self.lines[self.cy]
                 self.lines[self.cy] = curr[:self.cx] + event.unicode + curr[self.cx:]
+                self.line_surfs[self.cy] = self.render_line(self.lines[self.cy])
                 self.cx += 1
             elif event.key == pygame.K_TAB:
                 curr = self.lines[self.cy]
                 self.lines[self.cy] = curr[:self.cx] + "    " + curr[self.cx:]
+                self.line_surfs[self.cy] = self.render_line(self.lines[self.cy])
                 self.cx += 4
+            self.cursor_px = self.font.size(self.lines[self.cy][:self.cx])[0]
 
     def execute_code(self):
         code = "\n".join(self.lines)
@@ -322,10 +424,13 @@ class CodeEditorApp(Application):
             except Exception as e:
                 print(f"Error: {e}")
         
-        self.output = f.getvalue().split("\n")
+        self.output.clear()
+        self.output.extend(f.getvalue().split("\n"))
+        self.dirty = True
 
     def update(self):
         self.blink = (self.blink + 1) % 60
+        if self.blink % 30 == 0: self.dirty = True
 
     def draw(self, surface):
         super().draw(surface)
@@ -334,7 +439,7 @@ class CodeEditorApp(Application):
         # Toolbar
         btn_rect = pygame.Rect(10, 10, 60, 25)
         pygame.draw.rect(surface, (40, 180, 100), btn_rect, border_radius=4)
-        surface.blit(self.os.font_bold.render("RUN", True, THEME["text_dark"]), (25, 14))
+        surface.blit(self.os.render_cache.get(self.os.font_bold, "RUN", THEME["text_dark"]), (25, 14))
 
         # Editor Area
         ed_rect = pygame.Rect(10, 45, w - 20, h - 180)
@@ -342,17 +447,13 @@ class CodeEditorApp(Application):
         pygame.draw.rect(surface, THEME["title_bar"], ed_rect, 2)
 
         y_off = 50
-        for i, line in enumerate(self.lines):
-            # Render Line Numbers
-            num_surf = self.font.render(str(i+1), True, (100, 100, 110))
-            surface.blit(num_surf, (15, y_off))
-            # Render Text
-            text_surf = self.font.render(line, True, THEME["text_main"])
-            surface.blit(text_surf, (45, y_off))
+        for i, line_surf in enumerate(self.line_surfs):
+            surface.blit(self.linenum_surfs[i], (15, y_off))
+            surface.blit(line_surf, (45, y_off))
             
             # Cursor
             if i == self.cy and self.blink < 30:
-                cx_px = 45 + self.font.size(line[:self.cx])[0]
+                cx_px = 45 + self.cursor_px
                 pygame.draw.line(surface, THEME["accent"], (cx_px, y_off + 2), (cx_px, y_off + 16), 2)
             
             y_off += 18
@@ -362,10 +463,10 @@ class CodeEditorApp(Application):
         out_rect = pygame.Rect(10, h - 125, w - 20, 115)
         pygame.draw.rect(surface, (5, 5, 8), out_rect)
         pygame.draw.rect(surface, THEME["title_bar"], out_rect, 2)
-        surface.blit(self.font.render("Console Output:", True, (100, 100, 100)), (15, h - 120))
+        surface.blit(self.os.render_cache.get(self.font, "Console Output:", (100, 100, 100)), (15, h - 120))
         
         y_off = h - 100
-        for line in self.output[-5:]:  # Show last 5 lines
+        for line in list(itertools.islice(reversed(self.output), 5))[::-1]:  # Show last 5 lines
             surface.blit(self.font.render(line, True, THEME["accent"]), (15, y_off))
             y_off += 16
 
@@ -406,14 +507,17 @@ class BrowserApp(Application):
         self.url = "nexus://home"
         self.input_url = self.url
         self.focused = False
-        self.content = self.PAGES[self.url]
+        self.load_page(self.url)
+        self.caret_phase = 0
 
     def handle_event(self, event, local_mouse_pos):
         if event.type == pygame.MOUSEBUTTONDOWN:
             url_rect = pygame.Rect(10, 10, self.window.rect.width - 20, 30)
             self.focused = url_rect.collidepoint(local_mouse_pos)
+            self.dirty = True
         
         elif event.type == pygame.KEYDOWN and self.focused:
+            self.dirty = True
             if event.key == pygame.K_RETURN:
                 self.load_page(self.input_url)
                 self.focused = False
@@ -424,10 +528,19 @@ class BrowserApp(Application):
 
     def load_page(self, url):
         self.url = url
+        self.dirty = True
         if url in self.PAGES:
-            self.content = self.PAGES[url]
+            content = self.PAGES[url]
         else:
-            self.content = [f"404 - '{url}' Not Found.", "DNS Resolution failed in Nexus Network."]
+            content = [f"404 - '{url}' Not Found.", "DNS Resolution failed in Nexus Network."]
+        # Pages are static, so rasterize once per load
+        self.content_surfs = [self.font.render(line, True, THEME["text_main"]).convert_alpha() for line in content]
+
+    def update(self):
+        phase = pygame.time.get_ticks() // 500 % 2
+        if phase != self.caret_phase:
+            self.caret_phase = phase
+            if self.focused: self.dirty = True
 
     def draw(self, surface):
         super().draw(surface)
@@ -439,13 +552,13 @@ class BrowserApp(Application):
         pygame.draw.rect(surface, THEME["code_bg"], url_rect)
         pygame.draw.rect(surface, color, url_rect, 2)
         
-        display_url = self.input_url + ("|" if self.focused and (pygame.time.get_ticks() // 500 % 2) else "")
+        display_url = self.input_url + ("|" if self.focused and self.caret_phase else "")
         surface.blit(self.font.render(display_url, True, THEME["text_main"]), (15, 16))
 
         # Content Area
         y_off = 60
-        for line in self.content:
-            surface.blit(self.font.render(line, True, THEME["text_main"]), (15, y_off))
+        for line_surf in self.content_surfs:
+            surface.blit(line_surf, (15, y_off))
             y_off += 20
 
 
@@ -458,6 +571,7 @@ class SnakeApp(Application):
         super().__init__(os_kernel, window)
         self.grid_size = 15
         self.snake = [(10, 10), (9, 10), (8, 10)]
+        self.snake_set = set(self.snake)
         self.dir = (1, 0)
         self.food = (15, 10)
         self.timer = 0
@@ -478,22 +592,25 @@ class SnakeApp(Application):
         self.timer += 1
         if self.timer > 6: # Move speed
             self.timer = 0
+            self.dirty = True
             head = self.snake[0]
             new_head = (head[0] + self.dir[0], head[1] + self.dir[1])
 
             # Collisions
-            if (new_head in self.snake or 
+            if (new_head in self.snake_set or 
                 new_head[0] < 0 or new_head[0] >= 20 or 
                 new_head[1] < 0 or new_head[1] >= 20):
                 self.game_over = True
                 return
 
             self.snake.insert(0, new_head)
+            self.snake_set.add(new_head)
             if new_head == self.food:
                 self.score += 10
-                self.food = (random.randint(0, 19), random.randint(0, 19))
+                while self.food in self.snake_set:
+                    self.food = (random.randint(0, 19), random.randint(0, 19))
             else:
-                self.snake.pop()
+                self.snake_set.discard(self.snake.pop())
 
     def draw(self, surface):
         super().draw(surface)
@@ -504,7 +621,7 @@ class SnakeApp(Application):
         pygame.draw.rect(surface, THEME["title_bar"], play_rect, 2)
 
         if self.game_over:
-            text = self.os.font_bold.render("GAME OVER - Press 'R' to Restart", True, THEME["danger"])
+            text = self.os.render_cache.get(self.os.font_bold, "GAME OVER - Press 'R' to Restart", THEME["danger"])
             surface.blit(text, (30, 150))
             return
 
@@ -513,10 +630,10 @@ class SnakeApp(Application):
         pygame.draw.rect(surface, THEME["danger"], (fx, fy, self.grid_size-1, self.grid_size-1))
 
         # Draw Snake
+        draw_rect, grid, cell = pygame.draw.rect, self.grid_size, self.grid_size - 1
+        head_color, body_color = THEME["accent"], THEME["title_bar_active"]
         for i, (sx, sy) in enumerate(self.snake):
-            color = THEME["accent"] if i == 0 else THEME["title_bar_active"]
-            px, py = 10 + sx * self.grid_size, 25 + sy * self.grid_size
-            pygame.draw.rect(surface, color, (px, py, self.grid_size-1, self.grid_size-1))
+            draw_rect(surface, head_color if i == 0 else body_color, (10 + sx * grid, 25 + sy * grid, cell, cell))
 
 
 # ==========================================
@@ -526,11 +643,18 @@ class Window:
     def __init__(self, x, y, width, height, title, app_class, os_kernel):
         self.rect = pygame.Rect(x, y, width, height)
         self.title = title
-        self.surface = pygame.Surface((width, height))
+        self.surface = pygame.Surface((width, height)).convert()
         self.app = app_class(os_kernel, self)
+        self.occluded = False
+        self.dirty = True # Title bar / border need repainting (focus changed)
         
         self.title_rect = pygame.Rect(0, 0, width, 25)
         self.close_rect = pygame.Rect(width - 25, 0, 25, 25)
+        # Indexed by is_active
+        self.title_surfs = (
+            os_kernel.font_bold.render(title, True, THEME["text_main"]).convert_alpha(),
+            os_kernel.font_bold.render(title, True, THEME["text_dark"]).convert_alpha()
+        )
 
 class AethelOS:
     def __init__(self):
@@ -541,7 +665,22 @@ class AethelOS:
 
         self.font_main = pygame.font.SysFont("segoe ui, arial", 14)
         self.font_bold = pygame.font.SysFont("segoe ui, arial", 14, bold=True)
-        self.font_mono = pygame.font.SysFont("consolas, monospace", 14)
+        # "monospace" is not a family SysFont can match, so look up real monospace fonts by name
+        mono_path = pygame.font.match_font("consolas, dejavusansmono, liberationmono, couriernew")
+        self.font_mono = pygame.font.Font(mono_path, 14) if mono_path else pygame.font.SysFont("consolas, monospace", 14)
+        self.render_cache = RenderCache()
+
+        # Monospace glyph atlas: with a fixed advance, text becomes one blit per character.
+        # The fallback font can be proportional, in which case text is rendered whole instead.
+        # Compare advances, not size(): ink boxes differ even in monospace fonts (e.g. an overhanging "W")
+        advances = {m[4] for m in self.font_mono.metrics("".join(chr(c) for c in range(32, 127))) if m}
+        self.mono_fixed = len(advances) == 1
+        self.mono_advance = advances.pop() if self.mono_fixed else self.font_mono.size("M")[0]
+        self.mono_atlas = {
+            (chr(c), color): self.font_mono.render(chr(c), True, color).convert_alpha()
+            for c in range(32, 127)
+            for color in (THEME["text_main"], THEME["accent"])
+        } if self.mono_fixed else {}
 
         self.state = "BOOT"
         self.boot_timer = 0
@@ -553,6 +692,12 @@ class AethelOS:
         self.dragging_window = None
         self.drag_offset = (0, 0)
 
+        # Screen regions changed this frame; a full flip is used when too much changed
+        self.dirty_rects = []
+        self.full_redraw = True
+        self.clock_minute = -1
+        self.clock_surf = None
+
         # Expanded App Ecosystem
         self.desktop_icons = [
             {"name": "Terminal", "app": TerminalApp, "pos": (20, 20)},
@@ -561,6 +706,55 @@ class AethelOS:
             {"name": "Browser", "app": BrowserApp, "pos": (100, 20)},
             {"name": "Snake", "app": SnakeApp, "pos": (100, 100)}
         ]
+        for icon in self.desktop_icons:
+            icon["rect"] = pygame.Rect(icon["pos"][0], icon["pos"][1], 60, 60)
+            icon["label_surf"] = self.font_main.render(icon["name"], True, THEME["text_main"]).convert_alpha()
+            icon["label_rect"] = icon["label_surf"].get_rect(centerx=icon["rect"].centerx, top=icon["rect"].bottom + 5)
+
+        # Static desktop: background, icons and the taskbar strip (the clock is drawn live)
+        self.desktop_surf = pygame.Surface(self.screen.get_size()).convert()
+        self.desktop_surf.fill(THEME["desktop_bg"])
+        self.draw_desktop_icons(self.desktop_surf)
+        self.draw_taskbar(self.desktop_surf)
+
+        self.close_icon = pygame.Surface((25, 25)).convert()
+        self.close_icon.fill(THEME["danger"])
+        pygame.draw.line(self.close_icon, THEME["text_main"], (8, 8), (17, 17), 2)
+        pygame.draw.line(self.close_icon, THEME["text_main"], (8, 17), (17, 8), 2)
+
+    def mono_width(self, text):
+        return len(text) * self.mono_advance if self.mono_fixed else self.font_mono.size(text)[0]
+
+    def blit_mono(self, surface, text, color, pos):
+        if not self.mono_fixed:
+            surface.blit(self.font_mono.render(text, True, color), pos)
+            return
+        x, y = pos
+        adv, atlas_get = self.mono_advance, self.mono_atlas.get
+        glyphs = []
+        add_glyph = glyphs.append
+        for j, ch in enumerate(text):
+            glyph = atlas_get((ch, color))
+            if glyph is None: glyph = self.render_cache.get(self.font_mono, ch, color)
+            add_glyph((glyph, (x + j * adv, y)))
+        surface.blits(glyphs, False)
+
+    def mark_dirty(self, rect):
+        rect = pygame.Rect(rect).clip(self.screen.get_rect())
+        if rect.w and rect.h: self.dirty_rects.append(rect)
+
+    def needs_flip(self):
+        total_area = sum(r.w * r.h for r in self.dirty_rects)
+        return (self.full_redraw or len(self.dirty_rects) >= 25 or
+                total_area >= SCREEN_WIDTH * SCREEN_HEIGHT * 0.4)
+
+    def present(self):
+        if self.needs_flip():
+            pygame.display.flip()
+        elif self.dirty_rects:
+            pygame.display.update(self.dirty_rects)
+        self.dirty_rects = []
+        self.full_redraw = False
 
     def get_ram_usage(self):
         return 32 + sum(win.app.MEMORY_FOOTPRINT for win in self.windows)
@@ -570,38 +764,49 @@ class AethelOS:
         w, h = app_class.DEFAULT_SIZE
         new_win = Window(180 + offset, 50 + offset, w, h, app_class.NAME, app_class, self)
         self.windows.append(new_win)
-        self.active_window = new_win
+        self.set_active_window(new_win)
+
+    def set_active_window(self, win):
+        # Title bar colors depend on focus; app content is unaffected
+        if win is self.active_window: return
+        for w in (self.active_window, win):
+            if w: w.dirty = True
+        self.active_window = win
 
     def handle_events(self):
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        # Poll after pumping the queue; mouse events carry their own position
+        mouse_pos = pygame.mouse.get_pos()
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
             if self.state == "DESKTOP":
-                self.handle_desktop_events(event)
-
-    def handle_desktop_events(self, event):
-        mouse_pos = pygame.mouse.get_pos()
+                self.handle_desktop_events(event, getattr(event, "pos", mouse_pos))
 
+    def handle_desktop_events(self, event, mouse_pos):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             clicked_window = None
-            for win in reversed(self.windows):
+            for idx in range(len(self.windows) - 1, -1, -1):
+                win = self.windows[idx]
                 if win.rect.collidepoint(mouse_pos):
                     clicked_window = win
                     break
             
             if clicked_window:
-                self.windows.remove(clicked_window)
-                self.windows.append(clicked_window)
-                self.active_window = clicked_window
+                if idx != len(self.windows) - 1:
+                    self.windows.append(self.windows.pop(idx))
+                    self.mark_dirty(win.rect)
+                self.set_active_window(clicked_window)
 
                 local_x = mouse_pos[0] - win.rect.x
                 local_y = mouse_pos[1] - win.rect.y
 
                 if win.close_rect.collidepoint(local_x, local_y):
-                    self.windows.remove(win)
-                    self.active_window = self.windows[-1] if self.windows else None
+                    self.mark_dirty(win.rect)
+                    del self.windows[-1]
+                    self.set_active_window(self.windows[-1] if self.windows else None)
                     return
                 
                 if win.title_rect.collidepoint(local_x, local_y):
@@ -609,12 +814,11 @@ class AethelOS:
                     self.drag_offset = (local_x, local_y)
                     return
             else:
-                self.active_window = None
+                self.set_active_window(None)
 
             if not clicked_window:
                 for icon in self.desktop_icons:
-                    icon_rect = pygame.Rect(icon["pos"][0], icon["pos"][1], 60, 60)
-                    if icon_rect.collidepoint(mouse_pos):
+                    if icon["rect"].collidepoint(mouse_pos):
                         self.launch_app(icon["app"])
                         return
 
@@ -623,22 +827,77 @@ class AethelOS:
 
         elif event.type == pygame.MOUSEMOTION:
             if self.dragging_window:
+                self.mark_dirty(self.dragging_window.rect)
                 self.dragging_window.rect.x = mouse_pos[0] - self.drag_offset[0]
                 self.dragging_window.rect.y = mouse_pos[1] - self.drag_offset[1]
+                self.mark_dirty(self.dragging_window.rect)
 
-        if event.type in [pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN] and self.active_window:
+        if event.type == pygame.KEYDOWN and self.active_window:
+            self.active_window.app.handle_event(event, None)
+        elif event.type == pygame.MOUSEBUTTONDOWN and self.active_window:
             local_pos = (mouse_pos[0] - self.active_window.rect.x, mouse_pos[1] - self.active_window.rect.y)
             self.active_window.app.handle_event(event, local_pos)
 
-    def draw_desktop_icons(self):
-        for icon in self.desktop_icons:
-            rect = pygame.Rect(icon["pos"][0], icon["pos"][1], 60, 60)
-            pygame.draw.rect(self.screen, THEME["title_bar"], rect, border_radius=8)
-            pygame.draw.rect(self.screen, THEME["accent"], rect, 2, border_radius=8)
+    def update_occlusion(self):
+        # A window is skipped when off-screen or fully covered by a single window above it
+        screen_rect = self.screen.get_rect()
+        above = []
+        for win in reversed(self.windows):
+            win.occluded = (not screen_rect.colliderect(win.rect) or
+                            any(rect.contains(win.rect) for rect in above))
+            above.append(win.rect)
+
+    def compose(self, rect):
+        # Rebuild one screen region back to front: desktop, windows in z-order, taskbar
+        self.screen.set_clip(rect)
+        blit = self.screen.blit
+        blit(self.desktop_surf, rect, rect)
+        for win in self.windows:
+            if not win.occluded and win.rect.colliderect(rect):
+                blit(win.surface, win.rect.topleft)
+        blit(self.desktop_surf, TASKBAR_RECT, TASKBAR_RECT)
+        blit(self.clock_surf, (SCREEN_WIDTH - 60, SCREEN_HEIGHT - TASKBAR_HEIGHT + 10))
+        self.screen.set_clip(None)
+
+    def draw_desktop(self):
+        for win in self.windows:
+            if win.occluded or not (win.app.dirty or win.dirty): continue
+            is_active = (win == self.active_window)
+            title_color = THEME["title_bar_active"] if is_active else THEME["title_bar"]
+            
+            pygame.draw.rect(win.surface, title_color, win.title_rect)
+            win.surface.blit(win.title_surfs[is_active], (10, 3))
+            win.surface.blit(self.close_icon, win.close_rect)
             
-            text = self.font_main.render(icon["name"], True, THEME["text_main"])
-            text_rect = text.get_rect(centerx=rect.centerx, top=rect.bottom + 5)
-            self.screen.blit(text, text_rect)
+            pygame.draw.rect(win.surface, THEME["accent"] if is_active else THEME["title_bar"], (0, 0, win.rect.width, win.rect.height), 1)
+            win.app.dirty = win.dirty = False
+            self.mark_dirty(win.rect)
+
+        minute = int(time.time() // 60)
+        if minute != self.clock_minute:
+            self.clock_minute = minute
+            self.clock_surf = self.font_main.render(datetime.now().strftime("%H:%M"), True, THEME["text_main"]).convert_alpha()
+            self.mark_dirty(CLOCK_RECT)
+
+        # The screen persists between frames; nothing dirty means nothing is redrawn
+        if self.needs_flip():
+            self.full_redraw = True
+            self.compose(self.screen.get_rect())
+        else:
+            for rect in self.dirty_rects:
+                self.compose(rect)
+
+    def draw_taskbar(self, surface):
+        taskbar_rect = pygame.Rect(TASKBAR_RECT)
+        pygame.draw.rect(surface, THEME["taskbar_bg"], taskbar_rect)
+        pygame.draw.line(surface, THEME["accent"], taskbar_rect.topleft, taskbar_rect.topright, 2)
+
+    def draw_desktop_icons(self, surface):
+        draw_rect, fill_color, edge_color = pygame.draw.rect, THEME["title_bar"], THEME["accent"]
+        for icon in self.desktop_icons:
+            draw_rect(surface, fill_color, icon["rect"], border_radius=8)
+            draw_rect(surface, edge_color, icon["rect"], 2, border_radius=8)
+            surface.blit(icon["label_surf"], icon["label_rect"])
 
     def run(self):
         while True:
@@ -649,13 +908,17 @@ class AethelOS:
             # Update State
             if self.state == "BOOT":
                 self.boot_timer += 1
-                if self.boot_timer > 100: self.state = "DESKTOP"
+                if self.boot_timer > 100:
+                    self.state = "DESKTOP"
+                    self.full_redraw = True
             elif self.state == "DESKTOP":
                 # Precise App Load Measuring
+                self.update_occlusion()
                 for win in self.windows:
                     app_start = time.perf_counter()
                     win.app.update()
-                    win.app.draw(win.surface)
+                    if win.app.dirty and not win.occluded:
+                        win.app.draw(win.surface)
                     app_time = time.perf_counter() - app_start
                     
                     # Convert app execution time into CPU% (assumes 60 FPS target = 0.0166s per frame)
@@ -663,32 +926,14 @@ class AethelOS:
                     win.app.load = (win.app.load * 0.9) + (load_pct * 0.1) # Smooth out values
 
             # Draw Layer
-            self.screen.fill(THEME["desktop_bg"])
             if self.state == "BOOT":
-                self.screen.blit(self.font_mono.render("Initializing OS Kernel...", True, THEME["accent"]), (20, 20))
+                if self.full_redraw:
+                    self.screen.fill(THEME["desktop_bg"])
+                    self.screen.blit(self.render_cache.get(self.font_mono, "Initializing OS Kernel...", THEME["accent"]), (20, 20))
             elif self.state == "DESKTOP":
-                self.draw_desktop_icons()
-                for win in self.windows:
-                    is_active = (win == self.active_window)
-                    title_color = THEME["title_bar_active"] if is_active else THEME["title_bar"]
-                    
-                    pygame.draw.rect(win.surface, title_color, win.title_rect)
-                    win.surface.blit(self.font_bold.render(win.title, True, THEME["text_dark"] if is_active else THEME["text_main"]), (10, 3))
-                    
-                    pygame.draw.rect(win.surface, THEME["danger"], win.close_rect)
-                    pygame.draw.line(win.surface, THEME["text_main"], (win.close_rect.left + 8, 8), (win.close_rect.right - 8, 17), 2)
-                    pygame.draw.line(win.surface, THEME["text_main"], (win.close_rect.left + 8, 17), (win.close_rect.right - 8, 8), 2)
-                    
-                    pygame.draw.rect(win.surface, THEME["accent"] if is_active else THEME["title_bar"], (0, 0, win.rect.width, win.rect.height), 1)
-                    self.screen.blit(win.surface, win.rect.topleft)
+                self.draw_desktop()
 
-                # Taskbar
-                taskbar_rect = pygame.Rect(0, SCREEN_HEIGHT - TASKBAR_HEIGHT, SCREEN_WIDTH, TASKBAR_HEIGHT)
-                pygame.draw.rect(self.screen, THEME["taskbar_bg"], taskbar_rect)
-                pygame.draw.line(self.screen, THEME["accent"], taskbar_rect.topleft, taskbar_rect.topright, 2)
-                self.screen.blit(self.font_main.render(datetime.now().strftime("%H:%M"), True, THEME["text_main"]), (SCREEN_WIDTH - 60, SCREEN_HEIGHT - TASKBAR_HEIGHT + 10))
-
-            pygame.display.flip()
+            self.present()
             
             # FRAME TIMING END & OS LOAD CALC
             frame_time = time.perf_counter() - frame_start